@@ -0,0 +1,114 @@
+"""JSON file helpers for scene files.
+
+Uses orjson (C extension, several times faster on large keyframe payloads)
+when it is installed, and falls back to the standard ``json`` module
+otherwise. Both backends write UTF-8 with a 2-space indentation.
+
+Files whose name ends with ``.bazs`` are zstd-compressed compact JSON (no
+indentation: they are not meant to be read by hand, and the stdlib encoder
+only uses its C accelerator without ``indent``); this needs the optional
+``zstandard`` package. Compressed files are recognised on load by
+their magic bytes, whatever their extension.
+
+Files whose name ends with one of :data:`MSGPACK_SUFFIXES` (``.bascene``)
+hold the same document in binary MessagePack; this needs the optional
+``msgpack`` package. All entry points (scene model and UI save/load) go
+through :func:`dump_file`/:func:`load_file`, so the extension means the
+same format everywhere.
+"""
+
+import json
+from os import PathLike, fspath
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # dépendance optionnelle
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # dépendance optionnelle (scènes compressées)
+    zstandard = None
+
+try:
+    import msgpack
+except ImportError:  # dépendance optionnelle (format binaire)
+    msgpack = None
+
+# orjson.JSONDecodeError hérite de json.JSONDecodeError : un seul type à intercepter
+JSONDecodeError = json.JSONDecodeError
+
+PathArg = Union[str, PathLike[str]]
+
+COMPRESSED_SUFFIX = ".bazs"
+ZSTD_LEVEL = 3
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+MSGPACK_SUFFIXES = (".bascene", ".msgpack")
+
+
+def _encode(data: Any, indent: bool = True) -> bytes:
+    """Serialize ``data`` to UTF-8 JSON bytes, indented or compact."""
+    if orjson is not None:
+        option: int = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        # OSError : traité comme une erreur de fichier par les appelants
+        raise OSError("Scène compressée : le paquet zstandard n'est pas installé")
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise OSError("Scène binaire : le paquet msgpack n'est pas installé")
+
+
+def dump_file(data: Any, file_path: PathArg) -> None:
+    """Write ``data`` as indented JSON to ``file_path``.
+
+    ``.bazs`` files are compact JSON compressed with zstd, and
+    :data:`MSGPACK_SUFFIXES` files are MessagePack.
+    """
+    path: str = fspath(file_path)
+    if path.endswith(MSGPACK_SUFFIXES):
+        _require_msgpack()
+        payload: bytes = msgpack.packb(data, use_bin_type=True)
+    else:
+        compressed: bool = path.endswith(COMPRESSED_SUFFIX)
+        if compressed:
+            _require_zstandard()
+        payload = _encode(data, indent=not compressed)
+        if compressed:
+            payload = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+    with open(file_path, "wb") as f:
+        f.write(payload)
+
+
+def load_file(file_path: PathArg) -> Any:
+    """Read and decode the document stored in ``file_path``."""
+    binary: bool = fspath(file_path).endswith(MSGPACK_SUFFIXES)
+    if binary:
+        _require_msgpack()
+    with open(file_path, "rb") as f:
+        raw: bytes = f.read()
+    if binary:
+        try:
+            return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+        except (ValueError, msgpack.UnpackException) as e:
+            raise OSError(f"Scène binaire illisible : {e}") from e
+    if raw.startswith(_ZSTD_MAGIC):
+        _require_zstandard()
+        try:
+            raw = zstandard.ZstdDecompressor().decompress(raw)
+        except zstandard.ZstdError as e:
+            raise OSError(f"Scène compressée illisible : {e}") from e
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
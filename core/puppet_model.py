@@ -8,7 +8,6 @@ are stored externally in ``puppet_config.json`` and loaded at runtime.
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass, field
-from collections import defaultdict
 import json
 import logging
 
@@ -17,12 +16,12 @@ from core.svg_loader import SvgLoader
 logger = logging.getLogger(__name__)
 
 
-def compute_child_map(parent_map: Dict[str, Optional[str]]) -> defaultdict[str, List[str]]:
+def compute_child_map(parent_map: Dict[str, Optional[str]]) -> Dict[str, List[str]]:
     """Compute reverse mapping: parent -> list of children."""
-    child_map: defaultdict[str, List[str]] = defaultdict(list)
+    child_map: Dict[str, List[str]] = {}
     for child, parent in parent_map.items():
         if parent:
-            child_map[parent].append(child)
+            child_map.setdefault(parent, []).append(child)
     return child_map
 
 # Mapping d'exception possible pour certains segments (ex : "torse" → "cou")
@@ -83,7 +82,7 @@ class Puppet:
         self.parent_map = data.get("parent", {})
         self.pivot_map = data.get("pivot", {})
         self.z_order_map = data.get("z_order", {})
-        self.child_map = dict(compute_child_map(self.parent_map))
+        self.child_map = compute_child_map(self.parent_map)
 
     def build_from_svg(self, svg_loader: 'SvgLoader') -> None:
         """Populate members from an SVG using the loaded configuration."""
@@ -146,12 +145,14 @@ def validate_svg_structure(
     pivot_map: Dict[str, str]
 ) -> None:
     """Audit the SVG against parent/pivot maps and print discrepancies."""
+    # Rien n'est émis sous WARNING : inutile de construire les ensembles.
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     groups_in_svg: set[str] = set(svg_loader.get_groups())
-    groups_in_map: set[str] = set(parent_map.keys())
-    pivots_in_map: set[str] = set(pivot_map.values())
-    missing_in_svg: set[str] = groups_in_map - groups_in_svg
-    extra_in_svg: set[str] = groups_in_svg - groups_in_map
-    pivots_missing: set[str] = pivots_in_map - groups_in_svg
+    pivots_in_map: frozenset[str] = frozenset(pivot_map.values())
+    missing_in_svg: set[str] = parent_map.keys() - groups_in_svg
+    extra_in_svg: set[str] = groups_in_svg.difference(parent_map)
+    pivots_missing: frozenset[str] = pivots_in_map - groups_in_svg
 
     logger.info("\n--- Audit Structure SVG ---")
     if missing_in_svg:
@@ -1,74 +1,327 @@
 """Graphical QGraphicsItems representing puppet pieces and handles."""
 
-from typing import Optional, Tuple, List, Any
+from typing import Optional, Tuple, List, Any, Sequence, Dict
 import logging
 import math
+import re
 
 from PySide6.QtWidgets import QGraphicsEllipseItem, QGraphicsSceneMouseEvent, QGraphicsItem
 from PySide6.QtSvgWidgets import QGraphicsSvgItem
-from PySide6.QtCore import Qt, QPointF
-from PySide6.QtGui import QBrush, QPen, QColor, QTransform
+from PySide6.QtCore import Qt, QPointF, QTimer
+from PySide6.QtGui import QBrush, QPen, QColor
 from PySide6.QtSvg import QSvgRenderer # Added for type hinting
 
 # --- Constantes ---
 PIVOT_KEYWORDS = ["coude", "genou", "hanche", "epaule", "cheville", "poignet", "cou"]
+# Une seule recherche compilée au lieu d'un test de sous-chaîne par mot-clé
+_PIVOT_RE = re.compile("|".join(map(re.escape, PIVOT_KEYWORDS)))
 HANDLE_Z_VALUE = 1000
 PIVOT_Z_VALUE = 999
+# Écart en dessous duquel une position/rotation est considérée inchangée
+TRANSFORM_EPSILON = 1e-6
+RAD_TO_DEG = 180.0 / math.pi
+
+# Styles partagés par toutes les poignées (Qt copie brush/pen à l'affectation)
+_TRANSPARENT_BRUSH = QBrush(Qt.transparent)
+_TRANSPARENT_PEN = QPen(Qt.transparent)
+_PIVOT_BRUSH = QBrush(QColor(70, 200, 255, 180))
+_OUTLINE_PEN = QPen(QColor(255, 255, 255, 180), 1)
+_HANDLE_OUTLINE_PEN = QPen(QColor(255, 255, 255, 180), 1.5)
 
 
 class RotationHandle(QGraphicsEllipseItem):
     """Circular handle used to rotate a ``PuppetPiece`` around its pivot."""
 
+    __slots__ = ("piece", "start_angle_rad", "start_rotation", "_pivot_scene")
+
     def __init__(self, piece: 'PuppetPiece') -> None:
         """Create a rotation handle bound to ``piece``."""
         super().__init__(-10, -10, 20, 20)
         self.piece: 'PuppetPiece' = piece
-        self.setBrush(QBrush(Qt.transparent))
-        self.setPen(QPen(Qt.transparent))
+        self.setBrush(_TRANSPARENT_BRUSH)
+        self.setPen(_TRANSPARENT_PEN)
         self.setFlag(QGraphicsItem.ItemIsMovable)
+        # Créée masquée (cf. PuppetPiece.set_handle_visibility)
+        self.setAcceptedMouseButtons(Qt.NoButton)
         self.setZValue(HANDLE_Z_VALUE)
-        self.start_angle: float = 0.0
+        self.start_angle_rad: float = 0.0
         self.start_rotation: float = 0.0
+        # Pivot en coordonnées scène, figé pendant un glisser (la rotation se fait autour)
+        self._pivot_scene: Optional[Tuple[float, float]] = None
 
     # pylint: disable=invalid-name
     def mousePressEvent(self, event: QGraphicsSceneMouseEvent) -> None:
         """Record starting angle and rotation when interaction begins."""
-        pivot_in_scene: QPointF = self.piece.mapToScene(self.piece.transformOriginPoint())
+        pivot_x, pivot_y = self._pivot_scene = self.piece.scene_pivot()
         mouse_in_scene: QPointF = event.scenePos()
-        vector: QPointF = mouse_in_scene - pivot_in_scene
-        self.start_angle = math.degrees(math.atan2(vector.y(), vector.x()))
+        self.start_angle_rad = math.atan2(
+            mouse_in_scene.y() - pivot_y,
+            mouse_in_scene.x() - pivot_x,
+        )
         self.start_rotation = self.piece.local_rotation
         super().mousePressEvent(event)
 
     # pylint: disable=invalid-name
     def mouseMoveEvent(self, event: QGraphicsSceneMouseEvent) -> None:
         """Rotate the bound piece based on mouse movement."""
-        pivot_in_scene: QPointF = self.piece.mapToScene(self.piece.transformOriginPoint())
+        pivot_x, pivot_y = self._pivot_scene or self.piece.scene_pivot()
         mouse_in_scene: QPointF = event.scenePos()
-        vector: QPointF = mouse_in_scene - pivot_in_scene
-        current_angle: float = math.degrees(math.atan2(vector.y(), vector.x()))
-        delta: float = current_angle - self.start_angle
+        current_rad: float = math.atan2(
+            mouse_in_scene.y() - pivot_y,
+            mouse_in_scene.x() - pivot_x,
+        )
+        # Un seul passage en degrés, ramené dans [-180, 180[
+        delta: float = (current_rad - self.start_angle_rad) * RAD_TO_DEG
+        delta = (delta + 180.0) % 360.0 - 180.0
         self.piece.rotate_piece(self.start_rotation + delta)
 
     # pylint: disable=invalid-name
     def mouseReleaseEvent(self, event: QGraphicsSceneMouseEvent) -> None:
         """Reset temporary rotation state after interaction."""
-        self.start_angle = 0.0
+        self.start_angle_rad = 0.0
         self.start_rotation = 0.0
+        self._pivot_scene = None
         super().mouseReleaseEvent(event)
 
 # pylint: disable=R0903
 class PivotHandle(QGraphicsEllipseItem):
     """Small circle visualizing the pivot point of a ``PuppetPiece``."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Construct a pivot handle with transparent styling."""
         super().__init__(-5, -5, 10, 10)
-        self.setBrush(QBrush(Qt.transparent))
-        self.setPen(QPen(Qt.transparent))
+        self.setBrush(_TRANSPARENT_BRUSH)
+        self.setPen(_TRANSPARENT_PEN)
         self.setZValue(PIVOT_Z_VALUE)
 
 
+# pylint: disable=R0913, R0914, R0917
+def propagate_poses(
+    parent_index: Sequence[int],
+    rel_dx: Sequence[float],
+    rel_dy: Sequence[float],
+    local_rotations: Sequence[float],
+    rotations: List[float],
+    pivots_x: List[float],
+    pivots_y: List[float],
+    trig_cache: Optional[Tuple[List[float], List[float], List[float]]] = None,
+) -> None:
+    """Forward kinematics over flat arrays ordered parents-first.
+
+    Entries whose ``parent_index`` is negative are roots: their ``rotations``
+    and scene pivots are inputs. Every other entry is filled in place from its
+    parent's world rotation and pivot and its own offset/local rotation. The
+    trig pair of each node is computed once and reused by all its children.
+
+    ``trig_cache`` is an optional ``(angles, cos, sin)`` triple kept between
+    calls: a node whose world rotation is unchanged reuses its trig pair (a
+    pure translation of the puppet then costs no trig at all).
+    """
+    count: int = len(parent_index)
+    if trig_cache is None:
+        trig_cache = ([math.nan] * count, [0.0] * count, [0.0] * count)
+    angles, cos_r, sin_r = trig_cache
+    for i, parent in enumerate(parent_index):
+        if parent >= 0:
+            cos_a: float = cos_r[parent]
+            sin_a: float = sin_r[parent]
+            dx: float = rel_dx[i]
+            dy: float = rel_dy[i]
+            pivots_x[i] = pivots_x[parent] + dx * cos_a - dy * sin_a
+            pivots_y[i] = pivots_y[parent] + dx * sin_a + dy * cos_a
+            rotations[i] = rotations[parent] + local_rotations[i]
+        rotation: float = rotations[i]
+        if rotation != angles[i]:
+            angle_rad: float = math.radians(rotation)
+            angles[i] = rotation
+            cos_r[i] = math.cos(angle_rad)
+            sin_r[i] = math.sin(angle_rad)
+
+
+# pylint: disable=R0902
+class PuppetRig:
+    """Flat, parents-first view of a rigged piece hierarchy.
+
+    The pieces below ``root`` are stored in depth-first pre-order together with
+    the index of their parent, so a whole-rig refresh is one call to
+    :func:`propagate_poses` followed by a single loop of Qt setters.
+    Each subtree is the contiguous slice ``pieces[i:subtree_end[i]]``.
+    Parent offsets are cached as flat columns; call :meth:`refresh_offsets`
+    after changing ``rel_to_parent`` (e.g. when scaling the puppet).
+    """
+
+    __slots__ = (
+        "pieces",
+        "parent_index",
+        "subtree_end",
+        "_index",
+        "rel_dx",
+        "rel_dy",
+        "_last_inputs",
+        "_trig",
+        "epoch",
+    )
+
+    def __init__(self, root: 'PuppetPiece') -> None:
+        """Flatten the hierarchy rooted at ``root``."""
+        self.pieces: List['PuppetPiece'] = []
+        self.parent_index: List[int] = []
+        stack: List[Tuple['PuppetPiece', int]] = [(root, -1)]
+        while stack:
+            piece, parent = stack.pop()
+            index: int = len(self.pieces)
+            self.pieces.append(piece)
+            self.parent_index.append(parent)
+            stack.extend((child, index) for child in reversed(piece.children))
+        count: int = len(self.pieces)
+        self._index: Dict['PuppetPiece', int] = {piece: i for i, piece in enumerate(self.pieces)}
+        # Pré-ordre : un nœud termine le sous-arbre de tous ses ancêtres
+        self.subtree_end: List[int] = list(range(1, count + 1))
+        for i in range(count - 1, 0, -1):
+            parent = self.parent_index[i]
+            if self.subtree_end[i] > self.subtree_end[parent]:
+                self.subtree_end[parent] = self.subtree_end[i]
+        self.rel_dx: List[float] = []
+        self.rel_dy: List[float] = []
+        # Incrémenté à chaque recalcul complet (les pièces ont pu être replacées)
+        self.epoch: int = 0
+        # (angle, cos, sin) par pièce, conservés d'un apply() à l'autre
+        self._trig: Tuple[List[float], List[float], List[float]] = (
+            [math.nan] * count, [0.0] * count, [0.0] * count
+        )
+        # Entrées du dernier apply() (pose racine + rotations locales), None = à recalculer
+        self._last_inputs: Optional[Tuple[float, float, float, List[float]]] = None
+        self.refresh_offsets()
+
+    def refresh_offsets(self) -> None:
+        """Re-read each piece's offset to its parent into the cached columns."""
+        self.rel_dx = [piece.rel_to_parent[0] for piece in self.pieces]
+        self.rel_dy = [piece.rel_to_parent[1] for piece in self.pieces]
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Force the next :meth:`apply` to recompute (poses changed outside the rig)."""
+        self._last_inputs = None
+
+    def apply_subtree(self, piece: 'PuppetPiece') -> None:
+        """Recompute ``piece`` and its descendants from its parent's current pose.
+
+        Same flat pass as :meth:`apply`, restricted to the subtree's slice.
+        """
+        first: int = self._index[piece]
+        parent_pos: int = self.parent_index[first]
+        if parent_pos < 0:
+            self.apply()
+            return
+        end: int = self.subtree_end[first]
+        parent: 'PuppetPiece' = self.pieces[parent_pos]
+        parent_pivot_x, parent_pivot_y = parent.scene_pivot()
+        # Repère local : 0 = parent, 1.. = tranche [first, end)
+        offset: int = first - 1
+        size: int = end - offset
+        rotations: List[float] = [0.0] * size
+        pivots_x: List[float] = [0.0] * size
+        pivots_y: List[float] = [0.0] * size
+        rotations[0] = parent.rotation()
+        pivots_x[0] = parent_pivot_x
+        pivots_y[0] = parent_pivot_y
+        propagate_poses(
+            [-1, 0] + [self.parent_index[i] - offset for i in range(first + 1, end)],
+            [0.0] + self.rel_dx[first:end],
+            [0.0] + self.rel_dy[first:end],
+            [0.0] + [p.local_rotation for p in self.pieces[first:end]],
+            rotations,
+            pivots_x,
+            pivots_y,
+        )
+        for k in range(1, size):
+            self.pieces[offset + k].set_scene_pose(pivots_x[k], pivots_y[k], rotations[k])
+        # Le sous-arbre a bougé sans passer par apply() : son cache n'est plus fiable
+        self.invalidate()
+        piece.update_handle_positions()
+
+    def apply(self) -> None:
+        """Recompute every descendant pose from the root's current pose.
+
+        Skipped when the root pose and every local rotation are the same as
+        in the previous call (e.g. replaying a frame where nothing moved).
+        """
+        pieces: List['PuppetPiece'] = self.pieces
+        count: int = len(pieces)
+        if count < 2:
+            return
+        root: 'PuppetPiece' = pieces[0]
+        root_pivot_x, root_pivot_y = root.scene_pivot()
+        root_rotation: float = root.rotation()
+        local_rotations: List[float] = [piece.local_rotation for piece in pieces]
+        inputs = (root_rotation, root_pivot_x, root_pivot_y, local_rotations)
+        if inputs == self._last_inputs:
+            return
+        self._last_inputs = inputs
+        self.epoch += 1
+        rotations: List[float] = [0.0] * count
+        pivots_x: List[float] = [0.0] * count
+        pivots_y: List[float] = [0.0] * count
+        rotations[0] = root_rotation
+        pivots_x[0] = root_pivot_x
+        pivots_y[0] = root_pivot_y
+        propagate_poses(
+            self.parent_index,
+            self.rel_dx,
+            self.rel_dy,
+            local_rotations,
+            rotations,
+            pivots_x,
+            pivots_y,
+            self._trig,
+        )
+        for i in range(1, count):
+            pieces[i].set_scene_pose(pivots_x[i], pivots_y[i], rotations[i])
+        root.update_handle_positions()
+
+
+class _SelectionTracker:
+    """Cache of the non-puppet items selected in a scene.
+
+    Connected once to ``selectionChanged``: the selection is only swept again
+    after it actually changed, not on every mouse press. Qt also emits that
+    signal when selected items leave the scene (``removeItem``, ``clear()``
+    deleting them), so the cache never hands out deleted items.
+    """
+
+    __slots__ = ("scene", "_dirty", "_non_puppet", "__weakref__")
+
+    def __init__(self, scene: Any) -> None:
+        self.scene = scene
+        self._dirty: bool = True
+        self._non_puppet: List[QGraphicsItem] = []
+        # Slot sur méthode liée : PySide6 garde une référence faible (__weakref__)
+        scene.selectionChanged.connect(self._invalidate)
+
+    def _invalidate(self) -> None:
+        self._dirty = True
+
+    def non_puppet_items(self) -> List[QGraphicsItem]:
+        """Return selected items that are not puppet pieces."""
+        if self._dirty:
+            self._non_puppet = [
+                it for it in self.scene.selectedItems() if not isinstance(it, PuppetPiece)
+            ]
+            self._dirty = False
+        return self._non_puppet
+
+    @staticmethod
+    def for_scene(scene: Any) -> '_SelectionTracker':
+        """Return the tracker attached to ``scene``, creating it on first use."""
+        tracker: Optional[_SelectionTracker] = getattr(scene, "_puppet_selection_tracker", None)
+        if tracker is None:
+            tracker = _SelectionTracker(scene)
+            setattr(scene, "_puppet_selection_tracker", tracker)
+        return tracker
+
+
 # pylint: disable=R0902
 class PuppetPiece(QGraphicsSvgItem):
     """Graphical item representing a puppet member (SVG group).
@@ -78,6 +331,29 @@ class PuppetPiece(QGraphicsSvgItem):
     offsets (rel_to_parent). It also owns optional rotation/pivot handles.
     """
 
+    # Shiboken keeps an instance __dict__ on the base, but the fixed attributes
+    # below live in slots so that dict stays empty.
+    __slots__ = (
+        "name",
+        "pivot_x",
+        "pivot_y",
+        "parent_piece",
+        "children",
+        "rel_to_parent",
+        "local_rotation",
+        "rig",
+        "_handle_update_timer",
+        "_handles_stale",
+        "_handles_visible",
+        "_propagation_suspended",
+        "_last_applied",
+        "handle_color",
+        "_handle_brush",
+        "pivot_handle",
+        "rotation_handle",
+        "_handle_local_xy",
+    )
+
     # pylint: disable=R0913, R0917
     def __init__(
         self,
@@ -102,11 +378,23 @@ class PuppetPiece(QGraphicsSvgItem):
         self.setTransformOriginPoint(self.pivot_x, self.pivot_y)
 
         self.parent_piece: Optional['PuppetPiece'] = None
-        self.children: List['PuppetPiece'] = []
+        # Liste pendant le montage, figée en tuple par freeze_hierarchy()
+        self.children: Sequence['PuppetPiece'] = []
         self.rel_to_parent: Tuple[float, float] = (0.0, 0.0)
         self.local_rotation: float = 0.0
+        # Vue aplatie de la hiérarchie, posée sur la racine par freeze_hierarchy()
+        self.rig: Optional[PuppetRig] = None
 
-        # No external geometry listeners (rolled back)
+        # Timer coalescing handle refreshes (created lazily on root pieces)
+        self._handle_update_timer: Optional[QTimer] = None
+        # Vrai tant que les poignées n'ont pas été replacées depuis le dernier changement de pose
+        self._handles_stale: bool = True
+        # Poignées masquées : aucun placement tant qu'elles ne sont pas réaffichées
+        self._handles_visible: bool = False
+        # Vrai pendant une mise à jour groupée : itemChange ne propage pas
+        self._propagation_suspended: bool = False
+        # Dernières entrées de update_transform_from_parent (pose du parent, rotation, offset)
+        self._last_applied: Optional[Tuple[Any, ...]] = None
 
         if "_droite" in name:
             self.handle_color: QColor = QColor(255, 70, 70, 150)
@@ -114,51 +402,95 @@ class PuppetPiece(QGraphicsSvgItem):
             self.handle_color: QColor = QColor(70, 255, 70, 150)
         else:
             self.handle_color: QColor = QColor(255, 200, 70, 150)
+        self._handle_brush: QBrush = QBrush(self.handle_color)
 
         self.pivot_handle: PivotHandle = PivotHandle()
-        if not any(keyword in name for keyword in PIVOT_KEYWORDS):
+        if _PIVOT_RE.search(name) is None:
             self.rotation_handle: Optional[RotationHandle] = RotationHandle(self)
-            brect = self.boundingRect()
-            if self.name == "torse":
-                self.handle_local_pos = QPointF(
-                    brect.center().x(),
-                    brect.center().y() - 40,
-                )
-            else:
-                self.handle_local_pos = brect.center()
+            center: QPointF = self.boundingRect().center()
+            # Position locale de la poignée en flottants : mapToScene(x, y) sans QPointF
+            self._handle_local_xy: Optional[Tuple[float, float]] = (
+                center.x(),
+                center.y() - 40 if self.name == "torse" else center.y(),
+            )
         else:
             self.rotation_handle = None
-            # Initialize if no rotation handle
-            self.handle_local_pos: Optional[QPointF] = None
+            self._handle_local_xy = None
 
 
     def set_handle_visibility(self, visible: bool) -> None:
-        """Show or hide pivot and rotation handles with themed styling."""
-        pen_color: QColor = QColor(255, 255, 255, 180)
+        """Show or hide pivot and rotation handles with themed styling.
+
+        Hidden handles are neither repositioned nor interactive; they are
+        placed again when shown. Nothing is done when the state is unchanged.
+        """
+        if visible == self._handles_visible:
+            return
+        self._handles_visible = visible
         if visible:
-            self.pivot_handle.setBrush(QBrush(QColor(70, 200, 255, 180)))
-            self.pivot_handle.setPen(QPen(pen_color, 1))
+            self.pivot_handle.setBrush(_PIVOT_BRUSH)
+            self.pivot_handle.setPen(_OUTLINE_PEN)
         else:
-            self.pivot_handle.setBrush(QBrush(Qt.transparent))
-            self.pivot_handle.setPen(QPen(Qt.transparent))
+            self.pivot_handle.setBrush(_TRANSPARENT_BRUSH)
+            self.pivot_handle.setPen(_TRANSPARENT_PEN)
 
         if self.rotation_handle:
             if visible:
-                self.rotation_handle.setBrush(QBrush(self.handle_color))
-                self.rotation_handle.setPen(QPen(pen_color, 1.5))
+                self.rotation_handle.setBrush(self._handle_brush)
+                self.rotation_handle.setPen(_HANDLE_OUTLINE_PEN)
             else:
-                self.rotation_handle.setBrush(QBrush(Qt.transparent))
-                self.rotation_handle.setPen(QPen(Qt.transparent))
+                self.rotation_handle.setBrush(_TRANSPARENT_BRUSH)
+                self.rotation_handle.setPen(_TRANSPARENT_PEN)
+            # Une poignée masquée (donc pas forcément à jour) ne doit pas capter les clics
+            self.rotation_handle.setAcceptedMouseButtons(
+                Qt.LeftButton if visible else Qt.NoButton
+            )
+
+        if visible and self._handles_stale:
+            self._place_handles()
 
     def update_handle_positions(self) -> None:
-        """Update scene positions of the pivot and rotation handles."""
-        pivot_pos: QPointF = self.mapToScene(self.pivot_x, self.pivot_y)
-        self.pivot_handle.setPos(pivot_pos)
-        if self.rotation_handle and self.handle_local_pos:
-            handle_pos: QPointF = self.mapToScene(self.handle_local_pos)
+        """Schedule a refresh of the handle positions of this piece's puppet.
+
+        Transform changes arrive in bursts (mouse drags, subtree propagation);
+        they are coalesced on the root piece into a single refresh of the whole
+        hierarchy on the next event-loop turn.
+        """
+        if not self._handles_visible:
+            return
+        root: 'PuppetPiece' = self
+        while root.parent_piece is not None:
+            root = root.parent_piece
+        timer: Optional[QTimer] = root._handle_update_timer  # pylint: disable=protected-access
+        if timer is None:
+            timer = QTimer(root)
+            timer.setSingleShot(True)
+            timer.setInterval(0)
+            timer.timeout.connect(root.refresh_handle_positions)
+            root._handle_update_timer = timer  # pylint: disable=protected-access
+        timer.start()
+
+    def refresh_handle_positions(self) -> None:
+        """Immediately update scene positions of the pivot and rotation handles.
+
+        Pieces whose handles are hidden, or whose pose has not changed since
+        their handles were last placed, are skipped.
+        """
+        # La liste aplatie du rig couvre toute la hiérarchie (pièce isolée : elle seule)
+        pieces: Sequence['PuppetPiece'] = self.rig.pieces if self.rig is not None else (self,)
+        for piece in pieces:
+            # pylint: disable=protected-access
+            if piece._handles_visible and piece._handles_stale:
+                piece._place_handles()
+
+    def _place_handles(self) -> None:
+        """Move this piece's handles onto its current pose."""
+        pivot_x, pivot_y = self.scene_pivot()
+        self.pivot_handle.setPos(pivot_x, pivot_y)
+        if self.rotation_handle and self._handle_local_xy:
+            handle_pos: QPointF = self.mapToScene(*self._handle_local_xy)
             self.rotation_handle.setPos(handle_pos)
-        for child in self.children:
-            child.update_handle_positions()
+        self._handles_stale = False
 
     # pylint: disable=invalid-name
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value: Any) -> Any:
@@ -168,53 +500,180 @@ class PuppetPiece(QGraphicsSvgItem):
             QGraphicsItem.ItemRotationHasChanged,
             QGraphicsItem.ItemScaleHasChanged,
         ):
-            self.update_handle_positions()
-            for child in self.children:
-                child.update_transform_from_parent()
+            self._handles_stale = True
+            if not self._propagation_suspended:
+                self.update_handle_positions()
+                self.update_children_transforms()
+        elif change == QGraphicsItem.ItemSceneHasChanged:
+            self._handles_stale = True
         return super().itemChange(change, value)
 
+    # pylint: disable=invalid-name
+    def setScale(self, scale: float) -> None:
+        """Scale the piece and mark its handles for repositioning.
+
+        Only root pieces send geometry notifications, so children are
+        invalidated here rather than in :meth:`itemChange`.
+        """
+        super().setScale(scale)
+        self._handles_stale = True
+
     def set_parent_piece(
         self,
         parent: "PuppetPiece",
         rel_x: float = 0.0,
         rel_y: float = 0.0,
     ) -> None:
-        """Define parent piece and relative offset in parent's local space."""
+        """Define parent piece and relative offset in parent's local space.
+
+        On an already frozen hierarchy, the rigs of the affected puppets are
+        rebuilt so the moved subtree keeps following its (new) parent.
+        """
+        previous: Optional['PuppetPiece'] = self.parent_piece
+        old_root: 'PuppetPiece' = self.root_piece()
+        # Hiérarchie déjà figée (rig posé sur l'ancienne ou la nouvelle racine)
+        rigged: bool = old_root.rig is not None or (
+            parent is not None and parent.root_piece().rig is not None
+        )
         self.parent_piece = parent
         self.rel_to_parent = (rel_x, rel_y)
-        if parent and self not in parent.children:
-            parent.children.append(self)
+        if previous is not None and previous is not parent:
+            if isinstance(previous.children, tuple):
+                previous.children = tuple(c for c in previous.children if c is not self)
+            else:
+                previous.children.remove(self)
+        if parent is not None:
+            if previous is not parent:
+                if isinstance(parent.children, tuple):
+                    parent.children = parent.children + (self,)
+                else:
+                    parent.children.append(self)
+            self.rig = None
+        if rigged:
+            # Les rigs aplatis ne connaissent pas le changement : on les reconstruit
+            for root in dict.fromkeys((self.root_piece(), old_root)):
+                root.freeze_hierarchy()
+
+    def root_piece(self) -> 'PuppetPiece':
+        """Return the root of this piece's hierarchy."""
+        root: 'PuppetPiece' = self
+        while root.parent_piece is not None:
+            root = root.parent_piece
+        return root
+
+    def ensure_rig(self) -> PuppetRig:
+        """Return this root's rig, freezing the hierarchy first if needed."""
+        if self.rig is None:
+            self.freeze_hierarchy()
+        return self.rig
+
+    def freeze_hierarchy(self) -> None:
+        """Turn the ``children`` lists of this subtree into tuples.
+
+        Called once rigging is complete: membership no longer changes and the
+        propagation loops iterate tuples. On a root, (re)builds its rig.
+        """
+        stack: List['PuppetPiece'] = [self]
+        while stack:
+            piece = stack.pop()
+            piece.children = tuple(piece.children)
+            stack.extend(piece.children)
+        if self.parent_piece is None:
+            previous_rig: Optional[PuppetRig] = self.rig
+            self.rig = PuppetRig(self)
+            if previous_rig is not None:
+                # Nouvelle époque : les poses mémorisées (_last_applied) sont périmées
+                self.rig.epoch = previous_rig.epoch + 1
 
     def update_transform_from_parent(self) -> None:
         """Recompute world transform from parent rotation and stored offset."""
         if not self.parent_piece:
             return
 
+        rig: PuppetRig = self.root_piece().ensure_rig()
         parent: 'PuppetPiece' = self.parent_piece
         parent_rotation: float = parent.rotation()
-        dx, dy = self.rel_to_parent
-        transform: QTransform = QTransform()
-        transform.rotate(parent_rotation)
-        transform.translate(dx, dy)
-        offset: QPointF = transform.map(QPointF(0.0, 0.0))
-        parent_pivot: QPointF = parent.mapToScene(parent.transformOriginPoint())
-        scene_pos: QPointF = parent_pivot + offset - QPointF(self.pivot_x, self.pivot_y)
-        self.setPos(scene_pos)
-        self.setRotation(parent_rotation + self.local_rotation)
-        self.update_handle_positions()
+        parent_pivot_x, parent_pivot_y = parent.scene_pivot()
+        applied = (
+            parent_rotation,
+            parent_pivot_x,
+            parent_pivot_y,
+            self.local_rotation,
+            self.rel_to_parent,
+            rig.epoch,
+        )
+        if applied == self._last_applied:
+            # Même pose de parent et même rotation locale : sous-arbre déjà à jour
+            return
+        self._last_applied = applied
+        rig.apply_subtree(self)
+
+    def scene_pivot(self) -> Tuple[float, float]:
+        """Return the pivot in scene coordinates as two floats.
+
+        Pieces have no Qt parent and rotate/scale around their origin, so the
+        pivot is simply pos + origin (no ``mapToScene``/``QPointF`` round-trip).
+        """
+        return self.x() + self.pivot_x, self.y() + self.pivot_y
+
+    def set_scene_pose(self, pivot_x: float, pivot_y: float, rotation: float) -> None:
+        """Place the pivot at the given scene point with the given rotation.
+
+        Setters are skipped when the value is unchanged to avoid needless
+        geometry notifications.
+        """
+        new_x: float = pivot_x - self.pivot_x
+        new_y: float = pivot_y - self.pivot_y
+        if abs(self.x() - new_x) > TRANSFORM_EPSILON or abs(self.y() - new_y) > TRANSFORM_EPSILON:
+            self.setPos(new_x, new_y)
+            self._handles_stale = True
+        if abs(self.rotation() - rotation) > TRANSFORM_EPSILON:
+            self.setRotation(rotation)
+            self._handles_stale = True
+
+    def update_children_transforms(self) -> None:
+        """Recompute the transforms of all descendants from this piece's pose.
+
+        Goes through the root's rig, built on first use when the hierarchy
+        was never frozen.
+        """
+        if not self.children:
+            return
+        rig: PuppetRig = self.root_piece().ensure_rig()
+        if self.parent_piece is None:
+            rig.apply()
+            return
         for child in self.children:
-            child.update_transform_from_parent()
+            rig.apply_subtree(child)
 
     def rotate_piece(self, angle_degrees: float) -> None:
         """Set local rotation and propagate transform updates to children."""
         self.local_rotation = angle_degrees
         if self.parent_piece:
+            # Propagates to the whole subtree
             self.update_transform_from_parent()
         else:
-            self.setRotation(self.local_rotation)
-            self.update_handle_positions()
-        for child in self.children:
-            child.update_transform_from_parent()
+            self.set_root_pose(self.local_rotation)
+
+    def set_root_pose(
+        self,
+        rotation: float,
+        pos: Optional[Tuple[float, float]] = None,
+    ) -> None:
+        """Rotate (and optionally move) a root piece, propagating only once.
+
+        Geometry notifications triggered by the setters are not propagated;
+        the subtree and the handles are refreshed a single time afterwards.
+        """
+        self._propagation_suspended = True
+        try:
+            if pos is not None:
+                self.setPos(pos[0], pos[1])
+            self.setRotation(rotation)
+        finally:
+            self._propagation_suspended = False
+        self.update_handle_positions()
+        self.update_children_transforms()
 
     # Deselect objects when starting to interact with a puppet piece to avoid accidental moves
     # pylint: disable=invalid-name
@@ -224,10 +683,9 @@ class PuppetPiece(QGraphicsSvgItem):
             if not event.modifiers() & (Qt.ShiftModifier | Qt.ControlModifier):
                 sc = self.scene()
                 if sc is not None:
-                    for it in list(sc.selectedItems()):
-                        # Keep selection on puppet pieces; clear for other items (objects)
-                        if not isinstance(it, PuppetPiece):
-                            it.setSelected(False)
+                    # Keep selection on puppet pieces; clear for other items (objects)
+                    for it in list(_SelectionTracker.for_scene(sc).non_puppet_items()):
+                        it.setSelected(False)
         except (RuntimeError, AttributeError):
             logging.exception("Failed to sanitize selection in mousePressEvent")
         super().mousePressEvent(event)
@@ -3,19 +3,35 @@
 This module contains pure data structures and serialization helpers used by the UI.
 """
 
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 import logging
-import json
-from dataclasses import dataclass, field, asdict
-from core.puppet_model import Puppet
+from dataclasses import dataclass, field
+from operator import itemgetter
+
+from core import json_io
 from core.scene_validation import (
     validate_settings,
     validate_objects,
     validate_keyframes,
 )
 
+if TYPE_CHECKING:
+    # Annotation seulement : puppet_model tire svg_loader et donc PySide6
+    from core.puppet_model import Puppet
+
+
+# Réglages sérialisés sous "settings" et leurs valeurs par défaut
+_SETTINGS_DEFAULTS: Dict[str, Any] = {
+    "start_frame": 0,
+    "end_frame": 100,
+    "fps": 24,
+    "scene_width": 1920,
+    "scene_height": 1080,
+    "background_path": None,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 # pylint: disable=R0902
 class SceneObject:
     """Représente un objet générique de la scène.
@@ -45,27 +61,41 @@ class SceneObject:
 
     def to_dict(self) -> Dict[str, Any]:
         """Sérialise l'objet pour l'export JSON."""
-        return asdict(self)
+        # Littéral explicite : asdict() parcourt et copie récursivement chaque champ
+        return {
+            "name": self.name,
+            "obj_type": self.obj_type,
+            "file_path": self.file_path,
+            "x": self.x,
+            "y": self.y,
+            "rotation": self.rotation,
+            "scale": self.scale,
+            "z": self.z,
+            "attached_to": self.attached_to,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SceneObject":
         """Construit un ``SceneObject`` depuis une structure dict."""
+        # Arguments positionnels (ordre des champs) et data.get lié : appelé
+        # pour chaque objet à l'import
+        get = data.get
         obj = cls(
-            name=data.get("name"),
-            obj_type=data.get("obj_type"),
-            file_path=data.get("file_path"),
-            x=data.get("x", 0),
-            y=data.get("y", 0),
-            rotation=data.get("rotation", 0),
-            scale=data.get("scale", 1.0),
-            z=data.get("z", 0),
+            get("name"),
+            get("obj_type"),
+            get("file_path"),
+            get("x", 0),
+            get("y", 0),
+            get("rotation", 0),
+            get("scale", 1.0),
+            get("z", 0),
         )
         attached = data.get("attached_to")
         if attached is not None:
             obj.attached_to = tuple(attached)
         return obj
 
-@dataclass
+@dataclass(slots=True)
 class Keyframe:
     """Snapshot of the scene state at a given frame.
 
@@ -97,7 +127,7 @@ class SceneModel:
     # -----------------------------
     # PUPPETS ET OBJETS
     # -----------------------------
-    def add_puppet(self, name: str, puppet: Puppet) -> None:
+    def add_puppet(self, name: str, puppet: "Puppet") -> None:
         """Register a puppet in the scene by name."""
         self.puppets[name] = puppet
 
@@ -147,8 +177,12 @@ class SceneModel:
         """
         kf = self.keyframes.get(index)
         if not kf:
+            # Ajout en fin (cas courant) : l'ordre du dict reste trié sans re-tri
+            in_order = not self.keyframes or index > next(reversed(self.keyframes))
             kf = Keyframe(index)
             self.keyframes[index] = kf
+            if not in_order:
+                self.keyframes = dict(sorted(self.keyframes.items()))
 
         if state is None:
             object_states = {name: obj.to_dict() for name, obj in self.objects.items()}
@@ -159,8 +193,6 @@ class SceneModel:
 
         kf.objects = object_states
         kf.puppets = puppet_states
-
-        self.keyframes = dict(sorted(self.keyframes.items()))
         return kf
 
     def remove_keyframe(self, index: int) -> None:
@@ -199,14 +231,7 @@ class SceneModel:
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the whole scene into a JSON-friendly dictionary."""
         return {
-            "settings": {
-                "start_frame": self.start_frame,
-                "end_frame": self.end_frame,
-                "fps": self.fps,
-                "scene_width": self.scene_width,
-                "scene_height": self.scene_height,
-                "background_path": self.background_path,
-            },
+            "settings": {key: getattr(self, key) for key in _SETTINGS_DEFAULTS},
             "puppets": list(self.puppets.keys()),
             "objects": {k: v.to_dict() for k, v in self.objects.items()},
             "keyframes": [
@@ -221,20 +246,16 @@ class SceneModel:
 
     def from_dict(self, data: Dict[str, Any]) -> None:
         """Load scene data from a dictionary produced by :meth:`to_dict`."""
-        settings = data.get("settings", {})
-        self.start_frame = settings.get("start_frame", 0)
-        self.end_frame = settings.get("end_frame", 100)
-        self.fps = settings.get("fps", 24)
-        self.scene_width = settings.get("scene_width", 1920)
-        self.scene_height = settings.get("scene_height", 1080)
-        self.background_path = settings.get("background_path")
+        settings = {**_SETTINGS_DEFAULTS, **(data.get("settings") or {})}
+        for key in _SETTINGS_DEFAULTS:
+            setattr(self, key, settings[key])
 
         self.objects.clear()
         for name, obj_data in data.get("objects", {}).items():
             obj_data["name"] = name
             self.objects[name] = SceneObject.from_dict(obj_data)
 
-        self.keyframes.clear()
+        pairs = []
         for kf_data in data.get("keyframes", []):
             index = kf_data.get("index")
             if index is None:
@@ -242,26 +263,30 @@ class SceneModel:
             new_kf = Keyframe(index)
             new_kf.objects = kf_data.get("objects", {})
             new_kf.puppets = kf_data.get("puppets", {})
-            self.keyframes[index] = new_kf
-
-        self.keyframes = dict(sorted(self.keyframes.items()))
+            pairs.append((index, new_kf))
+        # Un seul dict construit, déjà trié (tri stable : le dernier doublon l'emporte)
+        pairs.sort(key=itemgetter(0))
+        self.keyframes.clear()
+        self.keyframes.update(pairs)
 
     def export_json(self, file_path: str) -> None:
-        """Export the scene to a JSON file at ``file_path``."""
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        """Export the scene to a JSON file at ``file_path``.
+
+        The format follows the extension (see :mod:`core.json_io`): ``.bazs``
+        is compressed JSON, ``.bascene``/``.msgpack`` is MessagePack.
+        """
+        json_io.dump_file(self.to_dict(), file_path)
 
     def import_json(self, file_path: str) -> bool:
-        """Load scene data from a JSON file, returning success."""
+        """Load scene data from a JSON file (or a format chosen by extension), returning success."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_io.load_file(file_path)
             # Valider avant d'appliquer pour éviter tout état partiel
             if not self._validate_data(data):
                 logging.error("Import JSON invalide: structure non conforme")
                 return False
             self.from_dict(data)
             return True
-        except (IOError, json.JSONDecodeError) as e:
+        except (IOError, json_io.JSONDecodeError) as e:
             logging.error("Erreur lors du chargement du fichier : %s", e)
             return False
@@ -4,6 +4,10 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+# Réglages qui doivent être des entiers s'ils sont présents
+_INT_SETTING_KEYS = ("start_frame", "end_frame", "fps", "scene_width", "scene_height")
+_MISSING = object()
+
 
 def validate_settings(data: Any) -> bool:
     """Validate scene settings structure.
@@ -17,8 +21,12 @@ def validate_settings(data: Any) -> bool:
     if not isinstance(data, dict):
         logging.error("settings: expected dict, got %s", type(data).__name__)
         return False
-    for key in ("start_frame", "end_frame", "fps", "scene_width", "scene_height"):
-        if key in data and not isinstance(data[key], int):
+    for key in _INT_SETTING_KEYS:
+        value = data.get(key, _MISSING)
+        if value is _MISSING:
+            continue
+        # type() exact : rejette aussi les booléens (sous-classe de int)
+        if type(value) is not int:  # pylint: disable=unidiomatic-typecheck
             logging.error("settings: %s must be int", key)
             return False
     return True
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import logging
 import xml.etree.ElementTree as ET
 from typing import Dict, List, Optional, Tuple
@@ -18,6 +19,7 @@ BoundingBox = Tuple[float, float, float, float]
 # Constantes SVG
 SVG_NS: str = "http://www.w3.org/2000/svg"
 DEFAULT_NAMESPACES: Dict[str, str] = {"svg": SVG_NS}
+_GROUP_TAG: str = f"{{{SVG_NS}}}g"
 
 
 class SvgLoader:
@@ -30,6 +32,9 @@ class SvgLoader:
         self.root: ET.Element = self.tree.getroot()
         self.namespaces: Dict[str, str] = DEFAULT_NAMESPACES
         self.renderer: QSvgRenderer = QSvgRenderer(svg_path)
+        # Index des groupes construit en un seul parcours ; bounds mémoïsées
+        self._groups_by_id: Dict[str, ET.Element] = self._index_groups(self.root)
+        self._bounds_cache: Dict[str, Optional[QRectF]] = {}
 
     # -------------------------
     # Helpers privés
@@ -39,20 +44,39 @@ class SvgLoader:
 
         Retourne None si non trouvé/invalide.
         """
-        bounds_rect: QRectF = self.renderer.boundsOnElement(element_id)
+        try:
+            return self._bounds_cache[element_id]
+        except KeyError:
+            pass
+        bounds_rect: Optional[QRectF] = self.renderer.boundsOnElement(element_id)
         if bounds_rect.isNull():
-            return None
+            bounds_rect = None
+        self._bounds_cache[element_id] = bounds_rect
         return bounds_rect
 
+    @staticmethod
+    def _index_groups(root: ET.Element) -> Dict[str, ET.Element]:
+        """Indexe les ``<g>`` identifiés par id (premier rencontré, ordre du document)."""
+        groups: Dict[str, ET.Element] = {}
+        for elem in root.iter(_GROUP_TAG):
+            group_id = elem.get("id")
+            if group_id is not None and group_id not in groups:
+                groups[group_id] = elem
+        return groups
+
     @staticmethod
     def _rect_to_bbox(rect: QRectF) -> BoundingBox:
         """Convertit un QRectF en BoundingBox (x_min, y_min, x_max, y_max)."""
-        return rect.left(), rect.top(), rect.right(), rect.bottom()
+        # getCoords : un seul appel Qt au lieu de quatre
+        return rect.getCoords()
 
     @staticmethod
     def _clone_element(elem: ET.Element) -> ET.Element:
-        """Clone un élément XML (shallow copy structure)."""
-        return ET.fromstring(ET.tostring(elem))
+        """Clone un élément XML et tout son sous-arbre (copie profonde)."""
+        # deepcopy natif : évite l'aller-retour sérialisation/parsing
+        clone: ET.Element = copy.deepcopy(elem)
+        clone.tail = None  # comme le re-parsing, ne garde pas le texte qui suit
+        return clone
 
     # -------------------------
     # API publique
@@ -62,15 +86,12 @@ class SvgLoader:
         bounds_rect: Optional[QRectF] = self._get_bounds_rect(group_id)
         if bounds_rect is None:
             return None
-        return bounds_rect.left(), bounds_rect.top()
+        x_min, y_min, _, _ = bounds_rect.getCoords()
+        return x_min, y_min
 
     def get_groups(self) -> List[str]:
         """List the identifiers of all ``<g>`` groups."""
-        return [
-            elem.attrib["id"]
-            for elem in self.root.findall(".//svg:g", self.namespaces)
-            if "id" in elem.attrib
-        ]
+        return list(self._groups_by_id)
 
     def get_group_bounding_box(self, group_id: str) -> Optional[BoundingBox]:
         """Retourne la bounding box (x_min, y_min, x_max, y_max) du groupe."""
@@ -91,10 +112,7 @@ class SvgLoader:
 
     def extract_group(self, group_id: str, output_path: str) -> Optional[Point]:
         """Export ``group_id`` into a standalone SVG file and return its offset."""
-        group_elem: Optional[ET.Element] = self.root.find(
-            f".//svg:g[@id='{group_id}']",
-            self.namespaces,
-        )
+        group_elem: Optional[ET.Element] = self._groups_by_id.get(group_id)
         if group_elem is None:
             raise ValueError(f"Group '{group_id}' not found in SVG.")
 
@@ -1,12 +1,16 @@
 "Tests for puppet graphics items."
 
+import math
 from pathlib import Path
 
 import pytest
-from PySide6.QtWidgets import QApplication, QGraphicsItem
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QGraphicsItem, QGraphicsRectItem, QGraphicsScene
 
 from ui.main_window import MainWindow
+from core.svg_loader import SvgLoader
 import core.puppet_model as puppet_model
+from core.puppet_piece import PuppetPiece, PuppetRig, _SelectionTracker, propagate_poses
 
 @pytest.fixture(scope="module")
 def app():
@@ -31,6 +35,9 @@ def test_hierarchy_and_pivot(_app):
     # Vérifie la hiérarchie logique sans impact sur l'affichage
     assert forearm.parent_piece is elbow
     assert elbow.parent_piece is upper
+    # Hiérarchie figée après le montage
+    assert isinstance(upper.children, tuple)
+    assert elbow in upper.children
 
     # Pivots superposés avant rotation
     elbow_pos = elbow.mapToScene(elbow.transformOriginPoint())
@@ -79,3 +86,276 @@ def test_handle_target_pivot_exception(_app, monkeypatch):
 
     monkeypatch.setitem(puppet_model.HANDLE_EXCEPTION, "torse", "tete")
     assert puppet.get_handle_target_pivot("torse") == puppet.members["tete"].pivot
+
+
+def test_rig_order_and_subtrees(_app):
+    """The rig lists pieces parents-first with contiguous subtrees."""
+    window = MainWindow()
+    window.scene_controller.add_puppet(str(Path("assets/pantins/manu.svg").resolve()), "manu")
+    gis = window.object_manager.graphics_items
+    upper = gis["manu:haut_bras_droite"]
+    root = upper
+    while root.parent_piece is not None:
+        root = root.parent_piece
+    rig = root.rig
+
+    assert len(rig.pieces) == sum(1 for k in gis if k.startswith("manu:"))
+    for i, piece in enumerate(rig.pieces):
+        parent = rig.parent_index[i]
+        assert (parent < 0) == (piece.parent_piece is None)
+        if parent >= 0:
+            assert rig.pieces[parent] is piece.parent_piece
+            assert parent < i
+
+    first = rig.pieces.index(upper)
+    subtree = rig.pieces[first:rig.subtree_end[first]]
+    assert subtree[0] is upper
+    expected = set()
+    stack = [upper]
+    while stack:
+        piece = stack.pop()
+        expected.add(piece.name)
+        stack.extend(piece.children)
+    assert {p.name for p in subtree} == expected
+    assert {"coude_droite", "avant_bras_droite"} <= expected
+
+
+def test_handle_positions_follow_rotation(_app):
+    """Handle refreshes are coalesced and applied on the next event-loop turn."""
+    window = MainWindow()
+    window.scene_controller.add_puppet(str(Path("assets/pantins/manu.svg").resolve()), "manu")
+    gis = window.object_manager.graphics_items
+    upper = gis["manu:haut_bras_droite"]
+    forearm = gis["manu:avant_bras_droite"]
+    window.scene_controller.set_rotation_handles_visible(True)
+
+    upper.rotate_piece(30)
+    upper.rotate_piece(60)
+    QApplication.processEvents()
+
+    expected = forearm.mapToScene(forearm.transformOriginPoint())
+    assert forearm.pivot_handle.pos().x() == pytest.approx(expected.x())
+    assert forearm.pivot_handle.pos().y() == pytest.approx(expected.y())
+
+
+def test_hidden_handles_are_placed_when_shown(_app):
+    """Hidden handles are not moved; showing them places them on the pose."""
+    window = MainWindow()
+    window.scene_controller.add_puppet(str(Path("assets/pantins/manu.svg").resolve()), "manu")
+    gis = window.object_manager.graphics_items
+    upper = gis["manu:haut_bras_droite"]
+    forearm = gis["manu:avant_bras_droite"]
+    window.scene_controller.set_rotation_handles_visible(False)
+    assert upper.rotation_handle.acceptedMouseButtons() == Qt.NoButton
+
+    upper.rotate_piece(45)
+    QApplication.processEvents()
+    expected = forearm.mapToScene(forearm.transformOriginPoint())
+    assert forearm.pivot_handle.pos().x() != pytest.approx(expected.x())
+
+    window.scene_controller.set_rotation_handles_visible(True)
+    assert forearm.pivot_handle.pos().x() == pytest.approx(expected.x())
+    assert forearm.pivot_handle.pos().y() == pytest.approx(expected.y())
+    assert upper.rotation_handle.acceptedMouseButtons() == Qt.LeftButton
+    upper.set_handle_visibility(True)  # état inchangé : sans effet
+    assert upper.rotation_handle.acceptedMouseButtons() == Qt.LeftButton
+
+
+def test_puppet_added_while_handles_shown(_app):
+    """A puppet added while handles are toggled on starts with visible handles."""
+    window = MainWindow()
+    window.scene_controller.set_rotation_handles_visible(True)
+    window.scene_controller.add_puppet(str(Path("assets/pantins/manu.svg").resolve()), "manu")
+    gis = window.object_manager.graphics_items
+    upper = gis["manu:haut_bras_droite"]
+    forearm = gis["manu:avant_bras_droite"]
+
+    assert upper.rotation_handle.acceptedMouseButtons() == Qt.LeftButton
+    expected = forearm.scene_pivot()
+    assert forearm.pivot_handle.pos().x() == pytest.approx(expected[0])
+    assert forearm.pivot_handle.pos().y() == pytest.approx(expected[1])
+
+    window.scene_controller.set_rotation_handles_visible(False)
+    assert upper.rotation_handle.acceptedMouseButtons() == Qt.NoButton
+
+
+def test_set_root_pose_propagates_once(_app, monkeypatch):
+    """Batched root updates walk the rig a single time."""
+    window = MainWindow()
+    window.scene_controller.add_puppet(str(Path("assets/pantins/manu.svg").resolve()), "manu")
+    gis = window.object_manager.graphics_items
+    root = next(p for k, p in gis.items() if k.startswith("manu:") and p.parent_piece is None)
+    calls = []
+    original = PuppetRig.apply
+    monkeypatch.setattr(PuppetRig, "apply", lambda rig: (calls.append(1), original(rig)))
+
+    root.set_root_pose(25.0, (root.x() + 40, root.y() - 15))
+
+    assert len(calls) == 1
+    assert root.rotation() == pytest.approx(25.0)
+
+
+def test_scale_puppet_refreshes_rig_offsets(_app):
+    """Scaling a puppet scales the cached parent offsets used by the rig."""
+    window = MainWindow()
+    window.scene_controller.add_puppet(str(Path("assets/pantins/manu.svg").resolve()), "manu")
+    gis = window.object_manager.graphics_items
+    upper = gis["manu:haut_bras_droite"]
+    forearm = gis["manu:avant_bras_droite"]
+    before = math.dist(upper.scene_pivot(), forearm.scene_pivot())
+
+    window.scene_controller.puppet_ops.scale_puppet("manu", 2.0)
+
+    after = math.dist(upper.scene_pivot(), forearm.scene_pivot())
+    assert after == pytest.approx(before * 2.0)
+
+
+def test_rig_reapplies_after_direct_subtree_rotation(_app):
+    """Restoring a pose after rotating a limb directly re-places the limb."""
+    window = MainWindow()
+    window.scene_controller.add_puppet(str(Path("assets/pantins/manu.svg").resolve()), "manu")
+    gis = window.object_manager.graphics_items
+    upper = gis["manu:haut_bras_droite"]
+    root = upper
+    while root.parent_piece is not None:
+        root = root.parent_piece
+    root.update_children_transforms()
+    rest_rotation = upper.rotation()
+
+    upper.rotate_piece(upper.local_rotation + 30)
+    upper.local_rotation -= 30
+    root.update_children_transforms()
+
+    assert upper.rotation() == pytest.approx(rest_rotation)
+
+
+def test_limb_rotation_reapplies_after_rig_refresh(_app):
+    """A repeated limb rotation is not skipped once the rig re-posed the limb."""
+    window = MainWindow()
+    window.scene_controller.add_puppet(str(Path("assets/pantins/manu.svg").resolve()), "manu")
+    gis = window.object_manager.graphics_items
+    upper = gis["manu:haut_bras_droite"]
+    root = upper
+    while root.parent_piece is not None:
+        root = root.parent_piece
+
+    upper.rotate_piece(30)
+    posed = upper.rotation()
+    upper.local_rotation = 0
+    root.update_children_transforms()
+    upper.rotate_piece(30)
+
+    assert upper.rotation() == pytest.approx(posed)
+
+
+def test_attach_after_freeze_rebuilds_rig(_app):
+    """A piece attached to a frozen puppet joins its rig and follows its parent."""
+    window = MainWindow()
+    window.scene_controller.add_puppet(str(Path("assets/pantins/manu.svg").resolve()), "manu")
+    gis = window.object_manager.graphics_items
+    upper = gis["manu:haut_bras_droite"]
+    forearm = gis["manu:avant_bras_droite"]
+    root = forearm.root_piece()
+    renderer = window.object_manager.renderers["manu"]
+    extra = PuppetPiece("", "main_droite", 0.0, 0.0, renderer)
+
+    extra.set_parent_piece(forearm, 10.0, 0.0)
+    assert extra in root.rig.pieces
+    assert extra.rig is None
+    forearm.rotate_piece(90)
+    extra.rotate_piece(15)
+
+    pivot_x, pivot_y = forearm.scene_pivot()
+    angle = math.radians(forearm.rotation())
+    assert extra.scene_pivot() == pytest.approx(
+        (pivot_x + 10.0 * math.cos(angle), pivot_y + 10.0 * math.sin(angle))
+    )
+    assert extra.rotation() == pytest.approx(forearm.rotation() + 15)
+
+    extra.set_parent_piece(upper, 0.0, 0.0)
+    assert extra not in forearm.children
+    assert root.rig.pieces.count(extra) == 1
+    upper.rotate_piece(20)
+    assert extra.scene_pivot() == pytest.approx(upper.scene_pivot())
+
+
+def test_unfrozen_hierarchy_builds_rig_on_first_use(_app):
+    """Propagation on a hierarchy never frozen builds the rig instead of doing nothing."""
+    renderer = SvgLoader(str(Path("assets/pantins/manu.svg").resolve())).renderer
+    root = PuppetPiece("", "torse", 0.0, 0.0, renderer)
+    child = PuppetPiece("", "tete", 0.0, 0.0, renderer)
+    child.set_parent_piece(root, 10, 0)
+    assert root.rig is None
+
+    root.rotate_piece(90)
+    child.update_transform_from_parent()
+
+    assert root.rig is not None
+    assert child.scene_pivot() == pytest.approx((0.0, 10.0))
+    assert child.rotation() == pytest.approx(90)
+
+
+def test_propagate_poses_chain():
+    """Flat forward kinematics places children from their parent's pose."""
+    rotations = [90.0, 0.0, 0.0]
+    pivots_x = [5.0, 0.0, 0.0]
+    pivots_y = [5.0, 0.0, 0.0]
+    propagate_poses(
+        [-1, 0, 1],
+        [0.0, 10.0, 4.0],
+        [0.0, 0.0, 0.0],
+        [90.0, 15.0, -15.0],
+        rotations,
+        pivots_x,
+        pivots_y,
+    )
+    assert rotations == pytest.approx([90.0, 105.0, 90.0])
+    assert pivots_x[1] == pytest.approx(5.0)
+    assert pivots_y[1] == pytest.approx(15.0)
+    assert pivots_x[2] == pytest.approx(5.0 + 4.0 * math.cos(math.radians(105.0)))
+    assert pivots_y[2] == pytest.approx(15.0 + 4.0 * math.sin(math.radians(105.0)))
+
+
+def test_propagate_poses_reuses_trig_cache():
+    """Cached trig pairs are reused when rotations repeat and refreshed otherwise."""
+    cache = ([math.nan] * 2, [0.0] * 2, [0.0] * 2)
+    for root_rotation in (0.0, 0.0, 90.0):
+        rotations = [root_rotation, 0.0]
+        pivots_x = [0.0, 0.0]
+        pivots_y = [0.0, 0.0]
+        propagate_poses([-1, 0], [0.0, 10.0], [0.0, 0.0], [0.0, 0.0],
+                        rotations, pivots_x, pivots_y, cache)
+    assert cache[0] == [90.0, 90.0]
+    assert pivots_x[1] == pytest.approx(0.0, abs=1e-9)
+    assert pivots_y[1] == pytest.approx(10.0)
+
+
+def test_selection_tracker_follows_selection_changes(_app):
+    """Non-puppet selection is cached until the scene selection changes."""
+    scene = QGraphicsScene()
+    item = QGraphicsRectItem(0, 0, 10, 10)
+    item.setFlag(QGraphicsItem.ItemIsSelectable, True)
+    scene.addItem(item)
+    tracker = _SelectionTracker.for_scene(scene)
+    assert tracker is _SelectionTracker.for_scene(scene)
+    assert not tracker.non_puppet_items()
+
+    item.setSelected(True)
+    assert tracker.non_puppet_items() == [item]
+    item.setSelected(False)
+    assert not tracker.non_puppet_items()
+
+
+def test_selection_tracker_survives_clear(_app):
+    """The tracker connects next to other slots and drops items deleted by clear()."""
+    scene = QGraphicsScene()
+    scene.selectionChanged.connect(lambda: None)
+    item = QGraphicsRectItem(0, 0, 10, 10)
+    item.setFlag(QGraphicsItem.ItemIsSelectable, True)
+    scene.addItem(item)
+    tracker = _SelectionTracker.for_scene(scene)
+    item.setSelected(True)
+    assert tracker.non_puppet_items() == [item]
+
+    scene.clear()
+    assert not tracker.non_puppet_items()
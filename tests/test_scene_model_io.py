@@ -1,6 +1,10 @@
 """Tests for scene model serialization and deserialization."""
 import json
+from dataclasses import asdict
 
+import pytest
+
+from core import json_io
 from core.scene_model import SceneModel, SceneObject
 
 
@@ -19,6 +23,20 @@ def test_scene_object_roundtrip():
     assert cloned.scale == 0.5
     assert cloned.attached_to == ("p", "arm")
 
+
+def test_scene_object_from_dict_defaults():
+    """Missing keys fall back to the field defaults, in field order."""
+    obj = SceneObject.from_dict({"name": "rock", "obj_type": "svg", "file_path": "r.svg", "z": 4})
+    assert obj == SceneObject("rock", "svg", "r.svg", z=4)
+
+def test_scene_object_to_dict_matches_fields():
+    """The explicit serializer covers exactly the dataclass fields."""
+    obj = SceneObject("rock", "image", "rock.png", x=1, y=2, z=3)
+    obj.attach("p", "arm")
+    assert obj.to_dict() == asdict(obj)
+    assert not hasattr(obj, "__dict__")
+
+
 def test_scene_object_export_import(tmp_path):
     """Test that a scene with an object can be exported and imported."""
     scene = SceneModel()
@@ -69,3 +87,124 @@ def test_import_json_invalid_structure(tmp_path):
     assert ok is False
     # état non modifié
     assert scene.start_frame == 1
+
+
+def test_add_keyframe_keeps_index_order():
+    """Keyframes stay ordered by index whatever the insertion order."""
+    scene = SceneModel()
+    for index in (0, 10, 5, 20, 10, 1):
+        scene.add_keyframe(index)
+    assert list(scene.keyframes) == [0, 1, 5, 10, 20]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_io_roundtrip_with_both_backends(tmp_path, monkeypatch, use_orjson):
+    """Scene files are identical in content with or without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(json_io, "orjson", None)
+    elif json_io.orjson is None:
+        pytest.skip("orjson non installé")
+    scene = SceneModel()
+    scene.add_object(SceneObject("rock", "image", "rock.png", x=1.5))
+    scene.add_keyframe(3)
+    file_path = tmp_path / "scene.json"
+    scene.export_json(file_path)
+
+    assert json.loads(file_path.read_text(encoding="utf-8")) == json.loads(json.dumps(scene.to_dict()))
+    scene2 = SceneModel()
+    assert scene2.import_json(file_path) is True
+    assert list(scene2.keyframes) == [3]
+
+
+def test_msgpack_roundtrip(tmp_path):
+    """The binary scene format round-trips the same data as JSON."""
+    pytest.importorskip("msgpack")
+    scene = SceneModel()
+    obj = SceneObject("rock", "image", "rock.png", x=4, y=5)
+    obj.attach("p", "arm")
+    scene.add_object(obj)
+    scene.add_keyframe(2)
+    file_path = tmp_path / "scene.bascene"
+    scene.export_json(file_path)  # routé vers MessagePack par l'extension
+
+    assert file_path.read_bytes()[:1] != b"{"
+    scene2 = SceneModel()
+    assert scene2.import_json(file_path) is True
+    assert scene2.objects["rock"].attached_to == ("p", "arm")
+    assert list(scene2.keyframes) == [2]
+
+
+def test_msgpack_shared_with_json_io(tmp_path):
+    """The UI save path (json_io) and the model agree on ``.bascene``."""
+    pytest.importorskip("msgpack")
+    scene = SceneModel()
+    scene.add_keyframe(1)
+    file_path = tmp_path / "scene.bascene"
+    json_io.dump_file(scene.to_dict(), file_path)
+    scene2 = SceneModel()
+    assert scene2.import_json(file_path) is True
+    scene2.export_json(file_path)
+    assert json_io.load_file(file_path) == json.loads(json.dumps(scene.to_dict()))
+
+
+def test_msgpack_without_package(tmp_path, monkeypatch):
+    """Without msgpack the binary import fails gracefully and export raises OSError."""
+    monkeypatch.setattr(json_io, "msgpack", None)
+    scene = SceneModel()
+    assert scene.import_json(tmp_path / "scene.bascene") is False
+    with pytest.raises(OSError):
+        scene.export_json(tmp_path / "scene.bascene")
+
+
+def test_compressed_scene_roundtrip(tmp_path):
+    """``.bazs`` scenes are zstd-compressed JSON and load transparently."""
+    pytest.importorskip("zstandard")
+    scene = SceneModel()
+    scene.add_object(SceneObject("rock", "image", "rock.png", x=7))
+    scene.add_keyframe(1)
+    file_path = tmp_path / "scene.bazs"
+    scene.export_json(file_path)
+
+    assert file_path.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+    raw = json_io.zstandard.ZstdDecompressor().decompress(file_path.read_bytes())
+    assert b"\n" not in raw  # JSON compact, sans indentation
+    scene2 = SceneModel()
+    assert scene2.import_json(file_path) is True
+    assert scene2.objects["rock"].x == 7
+
+
+def test_compressed_scene_without_zstandard(tmp_path, monkeypatch):
+    """Without zstandard a compressed scene cannot be written."""
+    monkeypatch.setattr(json_io, "zstandard", None)
+    with pytest.raises(OSError):
+        SceneModel().export_json(tmp_path / "scene.bazs")
+
+
+def test_from_dict_sorts_keyframes_once():
+    """Keyframes loaded out of order end up sorted; a later duplicate wins."""
+    scene = SceneModel()
+    scene.from_dict({
+        "keyframes": [
+            {"index": 8, "objects": {}},
+            {"index": 2, "objects": {"a": {}}},
+            {"index": 5},
+            {"index": 2, "objects": {"b": {}}},
+        ]
+    })
+    assert list(scene.keyframes) == [2, 5, 8]
+    assert list(scene.keyframes[2].objects) == ["b"]
+
+
+def test_settings_defaults_roundtrip():
+    """Missing settings fall back to defaults and all settings are exported."""
+    scene = SceneModel()
+    scene.from_dict({"settings": {"fps": 12}})
+    assert (scene.fps, scene.start_frame, scene.end_frame) == (12, 0, 100)
+    assert scene.to_dict()["settings"] == {
+        "start_frame": 0,
+        "end_frame": 100,
+        "fps": 12,
+        "scene_width": 1920,
+        "scene_height": 1080,
+        "background_path": None,
+    }
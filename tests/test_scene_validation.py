@@ -17,6 +17,13 @@ def test_validate_settings(caplog):
         assert "fps" in caplog.text
 
 
+def test_validate_settings_rejects_null_and_bool():
+    """Present integer settings may be neither null nor booleans."""
+    assert validate_settings({"background_path": None}) is True
+    assert validate_settings({"fps": None}) is False
+    assert validate_settings({"end_frame": True}) is False
+
+
 def test_validate_objects(caplog):
     """Objects must map names to dicts."""
     assert validate_objects({"tree": {}}) is True
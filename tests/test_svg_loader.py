@@ -0,0 +1,80 @@
+"""Tests for the SVG loader helpers."""
+
+import pytest
+from PySide6.QtGui import QColor, QImage, QPainter
+
+from core.svg_loader import SvgLoader
+
+SVG = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 50">
+  <g id="body"><rect x="10" y="5" width="20" height="10"/>
+    <g id="arm"><rect x="40" y="20" width="10" height="10"/></g>
+  </g>
+  <g><rect x="0" y="0" width="1" height="1"/></g>
+</svg>
+"""
+
+
+def _write_svg(tmp_path):
+    path = tmp_path / "doll.svg"
+    path.write_text(SVG, encoding="utf-8")
+    return str(path)
+
+
+def test_groups_indexed_in_document_order(tmp_path):
+    """Only identified groups are listed, in document order."""
+    loader = SvgLoader(_write_svg(tmp_path))
+    assert loader.get_groups() == ["body", "arm"]
+    assert loader.get_group_bounding_box("arm") == (40.0, 20.0, 50.0, 30.0)
+    assert loader.get_group_offset("arm") == (40.0, 20.0)
+
+
+def test_bounds_are_memoized(tmp_path, monkeypatch):
+    """Repeated bbox/pivot/offset queries hit the renderer once per id."""
+    loader = SvgLoader(_write_svg(tmp_path))
+    calls = []
+    bounds_on_element = loader.renderer.boundsOnElement
+
+    class _Renderer:  # pylint: disable=too-few-public-methods
+        def boundsOnElement(self, element_id):  # pylint: disable=invalid-name
+            calls.append(element_id)
+            return bounds_on_element(element_id)
+
+    monkeypatch.setattr(loader, "renderer", _Renderer())
+    loader.get_group_bounding_box("body")
+    loader.get_pivot("body")
+    loader.get_group_offset("body")
+    loader.get_group_bounding_box("arm")
+    loader.get_group_bounding_box("arm")
+    assert calls == ["body", "arm"]
+
+
+def test_extract_group_uses_index(tmp_path):
+    """Extraction finds nested groups and still rejects unknown ids."""
+    loader = SvgLoader(_write_svg(tmp_path))
+    out = tmp_path / "arm.svg"
+    assert loader.extract_group("arm", str(out)) == (40.0, 20.0)
+    assert 'id="arm"' in out.read_text(encoding="utf-8")
+    with pytest.raises(ValueError):
+        loader.extract_group("nope", str(tmp_path / "nope.svg"))
+
+
+def test_renderer_resolves_relative_images(tmp_path, _app):
+    """Images referenced relative to the SVG file are rendered."""
+    swatch = QImage(4, 4, QImage.Format_ARGB32)
+    swatch.fill(QColor(255, 0, 0))
+    swatch.save(str(tmp_path / "red.png"))
+    path = tmp_path / "with_image.svg"
+    path.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        'xmlns:xlink="http://www.w3.org/1999/xlink" width="4" height="4">'
+        '<g id="img"><image x="0" y="0" width="4" height="4" xlink:href="red.png"/></g>'
+        "</svg>",
+        encoding="utf-8",
+    )
+    loader = SvgLoader(str(path))
+    canvas = QImage(4, 4, QImage.Format_ARGB32)
+    canvas.fill(0)
+    painter = QPainter(canvas)
+    loader.renderer.render(painter)
+    painter.end()
+    assert canvas.pixelColor(2, 2) == QColor(255, 0, 0)
@@ -14,7 +14,6 @@ from typing import Dict, Optional, Any, List
 from PySide6.QtWidgets import QGraphicsItem, QGraphicsPixmapItem
 from PySide6.QtSvgWidgets import QGraphicsSvgItem
 from PySide6.QtGui import QPixmap
-from PySide6.QtCore import QPointF
 
 from core.scene_model import Keyframe
 from core.puppet_piece import PuppetPiece
@@ -98,8 +97,8 @@ class OnionSkinManager:
             clone: PuppetPiece = PuppetPiece(
                 "",
                 member_name,
-                base_piece.transformOriginPoint().x(),
-                base_piece.transformOriginPoint().y(),
+                base_piece.pivot_x,
+                base_piece.pivot_y,
                 renderer=self.win.object_manager.renderers.get(puppet_name),
             )
             clone.setOpacity(opacity)
@@ -144,14 +143,12 @@ class OnionSkinManager:
                 sin_a = math.sin(angle_rad)
                 rotated_dx: float = dx * cos_a - dy * sin_a
                 rotated_dy: float = dx * sin_a + dy * cos_a
-                parent_pivot_scene: QPointF = clone_piece.mapToScene(
-                    clone_piece.transformOriginPoint()
-                )
-                scene_x: float = parent_pivot_scene.x() + rotated_dx
-                scene_y: float = parent_pivot_scene.y() + rotated_dy
+                parent_pivot_x, parent_pivot_y = clone_piece.scene_pivot()
+                scene_x: float = parent_pivot_x + rotated_dx
+                scene_y: float = parent_pivot_y + rotated_dy
                 child_clone.setPos(
-                    scene_x - child_clone.transformOriginPoint().x(),
-                    scene_y - child_clone.transformOriginPoint().y(),
+                    scene_x - child_clone.pivot_x,
+                    scene_y - child_clone.pivot_y,
                 )
                 child_state = p_puppet_state.get(child.name, {})
                 child_clone.setRotation(parent_rot + child_state.get("rotation", 0.0))
@@ -20,6 +20,8 @@ class PuppetOps:
 
     def __init__(self, win: MainWindowProtocol) -> None:
         self.win = win
+        # État courant du bouton « poignées », appliqué aussi aux pantins ajoutés ensuite
+        self.handles_visible: bool = False
 
     def add_puppet(self, file_path: str, puppet_name: str) -> None:
         """Adds a puppet to the scene."""
@@ -33,6 +35,9 @@ class PuppetOps:
         self.win.object_manager.puppet_paths[puppet_name] = file_path
         self.win.object_manager.puppet_z_offsets[puppet_name] = 0
         self._add_puppet_graphics(puppet_name, puppet, file_path, renderer, loader)
+        if self.handles_visible:
+            # Les pièces neuves naissent poignées masquées : on applique l'état courant
+            self.set_rotation_handles_visible(True)
         self.win.inspector_widget.refresh()
 
     def _add_puppet_graphics(
@@ -67,18 +72,19 @@ class PuppetOps:
                 piece.setFlag(QGraphicsItem.ItemIsMovable, True)
                 piece.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
 
+        for piece in pieces.values():
+            if piece.parent_piece is None:
+                piece.freeze_hierarchy()
+                # Une seule propagation par racine (le rig couvre tout le sous-arbre) ;
+                # les poignées, masquées à la création, seront placées à l'affichage
+                piece.update_children_transforms()
+
         for piece in pieces.values():
             self.win.scene.addItem(piece)
             self.win.scene.addItem(piece.pivot_handle)
             if piece.rotation_handle:
                 self.win.scene.addItem(piece.rotation_handle)
 
-        for piece in pieces.values():
-            if piece.parent_piece:
-                piece.update_transform_from_parent()
-            else:
-                piece.update_handle_positions()
-
         # Apply z offset if any (default 0)
         zoff: int = self.win.object_manager.puppet_z_offsets.get(puppet_name, 0)
         if zoff:
@@ -112,8 +118,9 @@ class PuppetOps:
                     f"{puppet_name}:{root_member.name}"
                 )
             ):
-                for child in root_piece.children:
-                    child.update_transform_from_parent()
+                if root_piece.rig is not None:
+                    root_piece.rig.refresh_offsets()
+                root_piece.update_children_transforms()
 
     def delete_puppet(self, puppet_name: str) -> None:
         """Deletes a puppet from the scene."""
@@ -206,6 +213,7 @@ class PuppetOps:
 
     def set_rotation_handles_visible(self, visible: bool) -> None:
         """Show or hide rotation handles of all puppet pieces."""
+        self.handles_visible = visible
         for item in self.win.object_manager.graphics_items.values():
             if isinstance(item, PuppetPiece):
                 item.set_handle_visibility(visible)
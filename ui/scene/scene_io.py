@@ -1,7 +1,6 @@
 """Module for handling scene import and export operations."""
 
 from __future__ import annotations
-import json
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
@@ -9,20 +8,27 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from PySide6.QtWidgets import QFileDialog
 from PySide6.QtCore import QTimer
 
+from core import json_io
+
 if TYPE_CHECKING:
     from ui.main_window import MainWindow
 
 def save_scene(win: 'MainWindow') -> None:
     """Opens a dialog to save the current scene to a JSON file."""
     file_path: str
-    file_path, _ = QFileDialog.getSaveFileName(win, "Sauvegarder la scène", "", "JSON Files (*.json)")
+    file_path, _ = QFileDialog.getSaveFileName(
+        win,
+        "Sauvegarder la scène",
+        "",
+        "JSON Files (*.json);;Scènes compressées (*.bazs);;Scènes binaires (*.bascene)",
+    )
     if file_path:
         export_scene(win, file_path)
 
 def load_scene(win: 'MainWindow') -> None:
     """Opens a dialog to load a scene from a JSON file."""
     file_path: str
-    file_path, _ = QFileDialog.getOpenFileName(win, "Charger une scène", "", "JSON Files (*.json)")
+    file_path, _ = QFileDialog.getOpenFileName(win, "Charger une scène", "", "Scènes (*.json *.bazs *.bascene)")
     if file_path:
         import_scene(win, file_path)
 
@@ -57,8 +63,7 @@ def export_scene(win: 'MainWindow', file_path: str) -> None:
     data["puppets_data"] = puppets_data
 
     try:
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+        json_io.dump_file(data, file_path)
         logging.info("Scene saved to %s", file_path)
     except (OSError, TypeError) as e:
         logging.error("Error saving scene '%s': %s", file_path, e)
@@ -67,8 +72,7 @@ def import_scene(win: MainWindow, file_path: str):
     """Imports a scene from a JSON file, rebuilding the entire scene state."""
     try:
         # Chargement du fichier JSON (exceptions ciblées)
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        data = json_io.load_file(file_path)
         
         create_blank_scene(win, add_default_puppet=False)
 
@@ -128,7 +132,7 @@ def import_scene(win: MainWindow, file_path: str):
         win.update_scene_from_model()
         QTimer.singleShot(0, lambda: (win.timeline_widget.set_current_frame(win.scene_model.current_frame or win.scene_model.start_frame), win.update_scene_from_model()))
 
-    except (OSError, json.JSONDecodeError) as e:
+    except (OSError, json_io.JSONDecodeError) as e:
         logging.error("Failed to load scene '%s': %s", file_path, e)
         create_blank_scene(win, add_default_puppet=False)
     except (RuntimeError, AttributeError, ValueError):
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_right
 from typing import Dict, Optional, Any, List, Tuple
 
 from PySide6.QtWidgets import QGraphicsItem
@@ -93,9 +94,11 @@ class StateApplier:
         gi.setZValue(int(prev_st.get("z", int(gi.zValue()))))
 
     def apply_puppet_states(self, graphics_items: Dict[str, Any], keyframes: Dict[int, Keyframe], index: int) -> None:
+        root_positions: Dict[str, Tuple[float, float]] = {}
         sorted_indices: List[int] = sorted(keyframes.keys())
-        prev_kf_index: int = next((i for i in reversed(sorted_indices) if i <= index), -1)
-        next_kf_index: int = next((i for i in sorted(sorted_indices) if i > index), -1)
+        split: int = bisect_right(sorted_indices, index)
+        prev_kf_index: int = sorted_indices[split - 1] if split else -1
+        next_kf_index: int = sorted_indices[split] if split < len(sorted_indices) else -1
 
         if prev_kf_index != -1 and next_kf_index != -1 and prev_kf_index != next_kf_index:
             prev_kf: Keyframe = keyframes[prev_kf_index]
@@ -117,7 +120,7 @@ class StateApplier:
                         next_pos: Tuple[float, float] = next_state['pos']
                         interp_x: float = prev_pos[0] + (next_pos[0] - prev_pos[0]) * ratio
                         interp_y: float = prev_pos[1] + (next_pos[1] - prev_pos[1]) * ratio
-                        piece.setPos(interp_x, interp_y)
+                        root_positions[f"{name}:{member_name}"] = (interp_x, interp_y)
         else:
             target_kf_index: int = prev_kf_index if prev_kf_index != -1 else next_kf_index
             if target_kf_index == -1:
@@ -128,31 +131,36 @@ class StateApplier:
                     piece: PuppetPiece = graphics_items[f"{name}:{member}"]
                     piece.local_rotation = member_state['rotation']
                     if not piece.parent_piece:
-                        piece.setPos(*member_state['pos'])
+                        root_positions[f"{name}:{member}"] = tuple(member_state['pos'])
 
-        # Propagate transforms to children
+        # Pose each root once, then propagate to its subtree a single time
         for name, puppet in self.win.scene_model.puppets.items():
             for root_member in puppet.get_root_members():
-                root_piece: PuppetPiece = graphics_items[f"{name}:{root_member.name}"]
-                root_piece.setRotation(root_piece.local_rotation)
-                for child in root_piece.children:
-                    child.update_transform_from_parent()
+                key: str = f"{name}:{root_member.name}"
+                root_piece: PuppetPiece = graphics_items[key]
+                root_piece.set_root_pose(root_piece.local_rotation, root_positions.get(key))
 
     def apply_object_states(self, graphics_items: Dict[str, Any], keyframes: Dict[int, Keyframe], index: int) -> None:
+        # Tri et découpage faits une seule fois pour tous les objets
+        si: List[int] = sorted(keyframes.keys())
+        split: int = bisect_right(si, index)
+        before: List[Tuple[int, Keyframe]] = [(i, keyframes[i]) for i in reversed(si[:split])]
+        after: List[Tuple[int, Keyframe]] = [(i, keyframes[i]) for i in si[split:]]
+
         def prev_and_next_state(obj_name: str) -> Tuple[Optional[int], Optional[Dict[str, Any]], Optional[int], Optional[Dict[str, Any]], bool]:
             """Return (prev_idx, prev_state, next_idx, next_state, visible) for an object.
 
             visible is False when the last keyframe at or before index omits the object
             (temporal deletion rule). In that case, other values may be None.
             """
-            si: List[int] = sorted(keyframes.keys())
-            last_kf_any: Optional[int] = next((i for i in reversed(si) if i <= index), None)
-            if last_kf_any is not None and obj_name not in keyframes[last_kf_any].objects:
+            if before and obj_name not in before[0][1].objects:
                 return None, None, None, None, False
-            prev_idx: Optional[int] = next((i for i in reversed(si) if i <= index and obj_name in keyframes[i].objects), None)
-            next_idx: Optional[int] = next((i for i in si if i > index and obj_name in keyframes[i].objects), None)
-            prev_state: Optional[Dict[str, Any]] = keyframes[prev_idx].objects.get(obj_name) if prev_idx is not None else None
-            next_state: Optional[Dict[str, Any]] = keyframes[next_idx].objects.get(obj_name) if next_idx is not None else None
+            prev_idx, prev_state = next(
+                ((i, kf.objects[obj_name]) for i, kf in before if obj_name in kf.objects), (None, None)
+            )
+            next_idx, next_state = next(
+                ((i, kf.objects[obj_name]) for i, kf in after if obj_name in kf.objects), (None, None)
+            )
             return prev_idx, prev_state, next_idx, next_state, True
 
         updated: int = 0